@@ -5,10 +5,20 @@ A tool to check if GraphQL introspection is enabled and automatically send all q
 """
 
 import argparse
+import cProfile
+import hashlib
+import heapq
 import json
+import os
+import re
 import sys
 import requests
+import threading
 import time
+import tracemalloc
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager, ExitStack
 from urllib.parse import urljoin
 
 # Introspection query to check if introspection is enabled
@@ -129,6 +139,321 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+class PhaseProfiler:
+    """Named phase timers with optional cProfile capture and memory tracing"""
+
+    def __init__(self):
+        self.enabled = False
+        self.trace_memory = False
+        self.hooks = []
+        self.stats = {}
+        self.worker_stats = {}
+        self._cprofile = None
+        self._cprofile_output = None
+        self._lock = threading.Lock()
+        self._mem_stack = []
+        self._started_tracing = False
+
+    def start(self, cprofile_output=None, trace_memory=False):
+        """
+        Enable phase timing
+
+        tracemalloc counts the whole process, so memory is only recorded for
+        phases on the main thread, and a phase's peak also includes whatever
+        worker threads allocated meanwhile. Treat the numbers as approximate.
+
+        Args:
+            cprofile_output: Write cProfile stats to this file on stop (optional)
+            trace_memory: Record peak memory per phase using tracemalloc
+        """
+        self.enabled = True
+        self.stats = {}
+        self.worker_stats = {}
+
+        # Without reset_peak (Python < 3.9) every phase would report the peak since start
+        if trace_memory and not hasattr(tracemalloc, 'reset_peak'):
+            print(f"{Colors.WARNING}[!] Memory tracing needs Python 3.9+, skipping it{Colors.ENDC}")
+            trace_memory = False
+        self.trace_memory = trace_memory
+
+        # Leave tracing alone on stop if embedding code had already started it
+        self._started_tracing = trace_memory and not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+
+        if cprofile_output:
+            self._cprofile_output = cprofile_output
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def stop(self):
+        """Disable phase timing and write cProfile stats if requested"""
+        if self._cprofile:
+            self._cprofile.disable()
+            try:
+                self._cprofile.dump_stats(self._cprofile_output)
+                print(f"{Colors.OKGREEN}[+] cProfile stats saved to {self._cprofile_output}{Colors.ENDC}")
+            except Exception as e:
+                print(f"{Colors.FAIL}[!] Failed to save cProfile stats: {e}{Colors.ENDC}")
+            self._cprofile = None
+
+        if self._started_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started_tracing = False
+
+        self.enabled = False
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Time a named phase and run any registered hooks around it
+
+        Args:
+            name: Phase name
+        """
+        if not self.enabled and not self.hooks:
+            yield
+            return
+
+        with ExitStack() as stack:
+            for hook in list(self.hooks):
+                stack.enter_context(hook(name))
+
+            if not self.enabled:
+                yield
+                return
+
+            on_main_thread = threading.current_thread() is threading.main_thread()
+            # A worker thread resetting the shared peak would corrupt the main thread's phases
+            trace_memory = self.trace_memory and on_main_thread
+            if trace_memory:
+                self._enter_memory()
+            start = time.perf_counter()
+            try:
+                yield
+            finally:
+                elapsed = time.perf_counter() - start
+                peak = self._exit_memory() if trace_memory else None
+                self._record(self.stats if on_main_thread else self.worker_stats, name, elapsed, peak)
+
+    def _enter_memory(self):
+        current, peak = tracemalloc.get_traced_memory()
+        # Nested phases reset the peak counter, so carry it up to the parents first
+        for entry in self._mem_stack:
+            entry[1] = max(entry[1], peak)
+        tracemalloc.reset_peak()
+        self._mem_stack.append([current, current])
+
+    def _exit_memory(self):
+        start_current, peak_seen = self._mem_stack.pop()
+        peak = max(tracemalloc.get_traced_memory()[1], peak_seen)
+        for entry in self._mem_stack:
+            entry[1] = max(entry[1], peak)
+        return peak - start_current
+
+    def _record(self, stats, name, elapsed, peak):
+        with self._lock:
+            entry = stats.setdefault(name, {'calls': 0, 'total': 0.0, 'max': 0.0, 'peak_memory': None})
+            entry['calls'] += 1
+            entry['total'] += elapsed
+            entry['max'] = max(entry['max'], elapsed)
+            if peak is not None:
+                entry['peak_memory'] = max(entry['peak_memory'] or 0, peak)
+
+    def report(self):
+        """Print summary tables of the main-thread and worker-thread phases"""
+        if not self.stats and not self.worker_stats:
+            return
+
+        print(f"\n{Colors.HEADER}{Colors.BOLD}=== PROFILE ==={Colors.ENDC}")
+        if self.stats:
+            print("Main thread (wall time, including nested phases):")
+            self._print_table(self.stats, self.trace_memory)
+        if self.worker_stats:
+            # Worker phases overlap, so their totals can exceed the wall time of the phase that ran them
+            print("\nWorker threads (summed across threads):")
+            self._print_table(self.worker_stats, False)
+
+    @staticmethod
+    def _print_table(stats, show_memory):
+        header = f"{'Phase':<22}{'Calls':>8}{'Total (s)':>12}{'Avg (ms)':>12}{'Max (ms)':>12}"
+        if show_memory:
+            header += f"{'Peak mem (KiB)':>16}"
+        print(f"{Colors.OKCYAN}{header}{Colors.ENDC}")
+
+        for name, entry in sorted(stats.items(), key=lambda item: item[1]['total'], reverse=True):
+            avg_ms = entry['total'] / entry['calls'] * 1000
+            line = f"{name:<22}{entry['calls']:>8}{entry['total']:>12.3f}{avg_ms:>12.2f}{entry['max'] * 1000:>12.2f}"
+            if show_memory:
+                peak = entry['peak_memory']
+                line += f"{peak / 1024:>16.1f}" if peak is not None else f"{'-':>16}"
+            print(line)
+
+PROFILER = PhaseProfiler()
+
+def phase(name):
+    """
+    Context manager timing a named phase on the global profiler
+
+    Args:
+        name: Phase name
+    """
+    return PROFILER.phase(name)
+
+def register_phase_hook(hook):
+    """
+    Attach a custom timer to every phase
+
+    Args:
+        hook: Callable taking the phase name and returning a context manager
+              that is entered for the duration of the phase
+    """
+    PROFILER.hooks.append(hook)
+
+def unregister_phase_hook(hook):
+    """
+    Detach a hook previously attached with register_phase_hook
+
+    Args:
+        hook: Hook callable
+    """
+    if hook in PROFILER.hooks:
+        PROFILER.hooks.remove(hook)
+
+# Bump when the plan layout or mock value generation changes to invalidate cached plans
+PLAN_FORMAT_VERSION = 1
+DEFAULT_PLAN_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'gqlxplorer', 'plans')
+
+PROGRESS_REFRESH_INTERVAL = 0.5
+PROGRESS_LOG_INTERVAL = 10.0
+PROGRESS_SLOWEST_COUNT = 3
+
+class ProgressTracker:
+    """Thread-safe counters updated by the request loop and read by the renderer"""
+
+    def __init__(self, total):
+        self.total = total
+        self.done = 0
+        self.errors = Counter()
+        self.slowest = []
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def record(self, name, elapsed, error_class=None):
+        """
+        Record a finished operation
+
+        Args:
+            name: Operation name
+            elapsed: Request duration in seconds
+            error_class: Error class string, or None on success
+        """
+        with self._lock:
+            self.done += 1
+            if error_class:
+                self.errors[error_class] += 1
+            if len(self.slowest) < PROGRESS_SLOWEST_COUNT:
+                heapq.heappush(self.slowest, (elapsed, name))
+            elif elapsed > self.slowest[0][0]:
+                heapq.heapreplace(self.slowest, (elapsed, name))
+
+    def snapshot(self):
+        """
+        Take a consistent copy of the counters
+
+        Returns:
+            Dictionary with done, total, rate, eta, errors and slowest
+        """
+        with self._lock:
+            done = self.done
+            errors = dict(self.errors)
+            slowest = sorted(self.slowest, reverse=True)
+
+        elapsed = time.monotonic() - self.started
+        rate = done / elapsed if elapsed > 0 else 0.0
+        eta = (self.total - done) / rate if rate > 0 else None
+        return {
+            'done': done,
+            'total': self.total,
+            'elapsed': elapsed,
+            'rate': rate,
+            'eta': eta,
+            'errors': errors,
+            'slowest': slowest
+        }
+
+class ProgressRenderer(threading.Thread):
+    """Background thread redrawing the progress view at a fixed rate"""
+
+    def __init__(self, tracker, stream=None, interval=None):
+        super().__init__(daemon=True)
+        self.tracker = tracker
+        self.stream = stream or sys.stdout
+        self.interactive = self.stream.isatty()
+        # Redrawing in place only works on a terminal; logs get an occasional status line
+        if interval is None:
+            interval = PROGRESS_REFRESH_INTERVAL if self.interactive else PROGRESS_LOG_INTERVAL
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._lines_drawn = 0
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.render()
+
+    def stop(self):
+        """Stop the renderer and draw the final state"""
+        self._stop_event.set()
+        if self.is_alive():
+            self.join()
+        self.render(final=True)
+
+    def render(self, final=False):
+        """
+        Draw the current progress view
+
+        Args:
+            final: Draw the full view even when not writing to a terminal
+        """
+        lines = self.format(self.tracker.snapshot())
+
+        if self.interactive:
+            # Move back to the start of the previous view and clear it
+            prefix = f"\033[{self._lines_drawn}F\033[J" if self._lines_drawn else ""
+            self.stream.write(prefix + "\n".join(lines) + "\n")
+            self._lines_drawn = len(lines)
+        else:
+            self.stream.write("\n".join(lines if final else lines[:1]) + "\n")
+        self.stream.flush()
+
+    @staticmethod
+    def format(snap):
+        """
+        Format a tracker snapshot as lines of text
+
+        Args:
+            snap: Snapshot from ProgressTracker.snapshot()
+
+        Returns:
+            List of lines, the first being a one-line summary
+        """
+        eta = f"{snap['eta']:.0f}s" if snap['eta'] is not None else "-"
+        error_count = sum(snap['errors'].values())
+        lines = [
+            f"{Colors.OKBLUE}[{snap['done']}/{snap['total']}]{Colors.ENDC} "
+            f"{snap['rate']:.1f} req/s | elapsed {snap['elapsed']:.0f}s | ETA {eta} | "
+            f"{Colors.WARNING if error_count else Colors.OKGREEN}errors {error_count}{Colors.ENDC}"
+        ]
+
+        for error_class, count in sorted(snap['errors'].items(), key=lambda item: item[1], reverse=True):
+            lines.append(f"    {Colors.WARNING}{error_class}: {count}{Colors.ENDC}")
+
+        if snap['slowest']:
+            lines.append(f"    {Colors.OKCYAN}Slowest:{Colors.ENDC}")
+            for elapsed, name in snap['slowest']:
+                lines.append(f"      {elapsed * 1000:8.1f} ms  {name}")
+        return lines
+
 def print_banner():
     """Print tool banner"""
     banner = f"""
@@ -249,13 +574,15 @@ def get_full_schema(url, proxy=None):
     """
     print(f"{Colors.OKBLUE}[*] Retrieving full schema...{Colors.ENDC}")
     
-    response = send_graphql_query(url, FULL_INTROSPECTION_QUERY, proxy)
+    with phase('schema_request'):
+        response = send_graphql_query(url, FULL_INTROSPECTION_QUERY, proxy)
     
     if not response:
         return None
     
     try:
-        data = response.json()
+        with phase('schema_decode'):
+            data = response.json()
         
         if 'data' in data and '__schema' in data['data']:
             print(f"{Colors.OKGREEN}[+] Successfully retrieved schema!{Colors.ENDC}")
@@ -268,6 +595,653 @@ def get_full_schema(url, proxy=None):
         print(f"{Colors.FAIL}[!] Failed to parse schema response{Colors.ENDC}")
         return None
 
+# graphql-js stops validating after 100 errors; the guard field takes one of them
+RECOVERY_BATCH_SIZE = 99
+RECOVERY_TYPE_BATCH_SIZE = 32
+RECOVERY_THREADS = 8
+RECOVERY_TYPE_ATTEMPTS = 3
+
+# Validation messages as worded by graphql-js and graphql-core (which uses single quotes)
+GRAPHQL_NAME_RE = re.compile(r'^[_A-Za-z][_0-9A-Za-z]*$')
+UNKNOWN_FIELD_RE = re.compile(r"""Cannot query field ["'](\w+)["'] on type ["'](\w+)["']""")
+UNKNOWN_ARGUMENT_RE = re.compile(r"""Unknown argument ["'](\w+)["'] on field ["'](?:\w+\.)?(\w+)["']""")
+SELECTION_REQUIRED_RE = re.compile(r"""Field ["'](\w+)["'] of type ["']([^"']+)["'] must have a selection of subfields""")
+NO_SELECTION_RE = re.compile(r"""Field ["'](\w+)["'] must not have a selection since type ["']([^"']+)["'] has no subfields""")
+REQUIRED_ARGUMENT_RE = re.compile(
+    r"""(?:Field ["'](\w+)["'] argument ["'](\w+)["']|Argument ["'](?:\w+\.)?(\w+)\((\w+):\)["'])"""
+    r""" of type ["']([^"']+)["'] is required"""
+)
+EXPECTED_TYPE_RE = re.compile(r"""Expected value of (?:non-null )?type ["']([^"']+)["']""")
+VARIABLE_TYPE_RE = re.compile(r"""Variable ["']\$v(\d+)["'] of type ["'][^"']+["'] used in position expecting type ["']([^"']+)["']""")
+SUGGESTION_RE = re.compile(r'Did you mean (?!to use)(.+?)\?')
+QUOTED_NAME_RE = re.compile(r"""["'](\w+)["']""")
+TOO_MANY_ERRORS = 'Too many validation errors'
+KNOWN_ERROR_PATTERNS = (
+    UNKNOWN_FIELD_RE, UNKNOWN_ARGUMENT_RE, SELECTION_REQUIRED_RE, NO_SELECTION_RE,
+    REQUIRED_ARGUMENT_RE, EXPECTED_TYPE_RE, VARIABLE_TYPE_RE
+)
+
+# Names starting with "__" are reserved, so no schema can define this field. Selecting it
+# in every probe makes each document fail validation, so the server never executes one.
+PROBE_GUARD_FIELD = '__gqlxplorerProbe'
+
+class SchemaRecovery:
+    """Rebuild a schema from validation errors when introspection is disabled"""
+
+    def __init__(self, url, wordlist, proxy=None, delay=0, batch_size=RECOVERY_BATCH_SIZE, threads=RECOVERY_THREADS):
+        self.url = url
+        self.proxy = proxy
+        self.delay = delay
+        self.batch_size = max(1, batch_size)
+        self.threads = max(1, threads)
+        self.words = dict.fromkeys(
+            word for word in wordlist if GRAPHQL_NAME_RE.match(word) and not word.startswith('__')
+        )
+        # type name -> {'kind', 'path': (keyword, [field, ...]), 'fields': {name: field}}
+        # field -> {'type': type string or None, 'object': bool, 'args': {name: type string or None}}
+        self.types = {}
+        self.query_type = None
+        self.mutation_type = None
+        self.requests_sent = 0
+        self.failed_requests = 0
+        self._probed_fields = {}
+        self._probed_args = {}
+        self._type_attempts = Counter()
+        self._arg_type_attempted = set()
+        self.abort_reason = None
+
+    def run(self):
+        """
+        Probe the endpoint until no new fields, arguments or types turn up
+
+        Returns:
+            Schema dictionary in introspection format or None if failed
+        """
+        self.query_type = self._root_type_name('query')
+        if not self.query_type:
+            reason = self.abort_reason or "could not determine the query type"
+            print(f"{Colors.FAIL}[!] Stopping schema recovery: {reason}{Colors.ENDC}")
+            return None
+        self._add_type(self.query_type, ('query', []))
+
+        self.mutation_type = self._root_type_name('mutation')
+        if self.mutation_type:
+            self._add_type(self.mutation_type, ('mutation', []))
+
+        with ThreadPoolExecutor(max_workers=self.threads) as pool:
+            round_number = 0
+            while True:
+                round_number += 1
+                jobs = []
+                for stage in (self._field_jobs, self._field_type_jobs, self._arg_jobs, self._arg_type_jobs):
+                    jobs += self._run_stage(pool, stage())
+                    if self.abort_reason:
+                        print(f"{Colors.FAIL}[!] Stopping schema recovery: {self.abort_reason}{Colors.ENDC}")
+                        return None
+
+                if not jobs:
+                    break
+
+                field_count = sum(len(info['fields']) for info in self.types.values())
+                print(f"{Colors.OKCYAN}    Round {round_number}: {len(self.types)} types, {field_count} fields, "
+                      f"{self.requests_sent} requests{Colors.ENDC}")
+
+        if self.failed_requests:
+            print(f"{Colors.WARNING}[!] {self.failed_requests} probe requests failed{Colors.ENDC}")
+
+        return self.build_schema()
+
+    def build_schema(self):
+        """
+        Convert the discovered types into the shape returned by get_full_schema
+
+        Leaf types cannot be told apart from the errors alone, so enums and
+        input objects are reported as SCALAR. Arguments whose type could not
+        be determined are left out so generated operations stay valid.
+
+        Returns:
+            Schema dictionary
+        """
+        kinds = {name: info['kind'] for name, info in self.types.items()}
+        leaf_names = set()
+        types = []
+
+        for type_name, info in self.types.items():
+            fields = []
+            for field_name, field in info['fields'].items():
+                args = []
+                for arg_name, arg_type in field['args'].items():
+                    if arg_type is None:
+                        continue
+                    leaf_names.add(self._base_name(arg_type))
+                    args.append({
+                        'name': arg_name,
+                        'description': None,
+                        'type': parse_type_name(arg_type, kinds),
+                        'defaultValue': None
+                    })
+
+                if field['type']:
+                    field_type = parse_type_name(field['type'], kinds)
+                    if not field['object']:
+                        leaf_names.add(self._base_name(field['type']))
+                else:
+                    field_type = {'kind': 'SCALAR', 'name': None, 'ofType': None}
+
+                fields.append({
+                    'name': field_name,
+                    'description': None,
+                    'args': args,
+                    'type': field_type,
+                    'isDeprecated': False,
+                    'deprecationReason': None
+                })
+
+            types.append(self._type_entry(info['kind'], type_name, fields))
+
+        for name in sorted(leaf_names - set(kinds)):
+            types.append(self._type_entry('SCALAR', name, None))
+
+        return {
+            'queryType': {'name': self.query_type},
+            'mutationType': {'name': self.mutation_type} if self.mutation_type else None,
+            'subscriptionType': None,
+            'types': types,
+            'directives': []
+        }
+
+    @staticmethod
+    def _type_entry(kind, name, fields):
+        return {
+            'kind': kind,
+            'name': name,
+            'description': None,
+            'fields': fields,
+            'inputFields': None,
+            'interfaces': [] if kind == 'OBJECT' else None,
+            'enumValues': None,
+            'possibleTypes': None
+        }
+
+    @staticmethod
+    def _base_name(type_name):
+        return type_name.strip('[]!')
+
+    def _add_type(self, type_name, path):
+        if type_name not in self.types:
+            self.types[type_name] = {'kind': 'OBJECT', 'path': path, 'fields': {}}
+
+    def _add_field(self, type_name, field_name):
+        fields = self.types[type_name]['fields']
+        if field_name not in fields:
+            fields[field_name] = {'type': None, 'object': False, 'args': {}}
+        return fields[field_name]
+
+    def _set_field_type(self, type_name, field_name, field_type, is_object):
+        field = self._add_field(type_name, field_name)
+        field['type'] = field_type
+        field['object'] = is_object
+        if is_object:
+            keyword, path = self.types[type_name]['path']
+            self._add_type(self._base_name(field_type), (keyword, path + [field_name]))
+
+    def _add_words(self, names):
+        for name in names:
+            if not name.startswith('__'):
+                self.words.setdefault(name, None)
+
+    def _run_stage(self, pool, jobs):
+        """
+        Run probe jobs in parallel and merge their results on this thread
+
+        Merge functions may return follow-up jobs, which run as part of the same stage.
+
+        Returns:
+            List of all jobs run
+        """
+        completed = []
+        futures = {}
+        jobs = list(jobs)
+        while jobs or futures:
+            for probe, args, merge in jobs:
+                futures[pool.submit(probe, *args)] = (merge, args)
+            jobs = []
+
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                merge, args = futures.pop(future)
+                completed.append(future)
+                result = future.result()
+                self.requests_sent += 1
+                if self.abort_reason:
+                    # Drop queued probes; ones already running return before posting
+                    for pending in futures:
+                        pending.cancel()
+                    return completed
+                if result is None:
+                    self.failed_requests += 1
+                    continue
+                jobs += merge(result, *args) or []
+        return completed
+
+    def _post(self, document):
+        body = encode_operation_body(document, {})
+        response = execute_prepared_operation(self.url, body, self.proxy, self.delay, verbose=False)
+        if response is None:
+            return None
+        try:
+            data = response.json()
+        except json.JSONDecodeError:
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _root_type_name(self, keyword):
+        """Read the root type name from the error for the guard field, without executing anything"""
+        data = self._post(f"{keyword} {{ {PROBE_GUARD_FIELD} }}")
+        errors = (data or {}).get('errors')
+        if not isinstance(errors, list):
+            return None
+        for error in errors:
+            if isinstance(error, dict):
+                match = UNKNOWN_FIELD_RE.search(error.get('message') or '')
+                if match and match.group(1) == PROBE_GUARD_FIELD:
+                    return match.group(2)
+        if keyword == 'query' and errors and isinstance(errors[0], dict):
+            self.abort_reason = f"unrecognized validation error: {errors[0].get('message')!r}"
+        return None
+
+    def _probe(self, type_name, candidates, variables='', open_lines=(), close_lines=()):
+        """
+        Send one batch of candidate lines nested at the path of a type
+
+        Each candidate sits on its own line so errors can be mapped back to it
+        through their location, even when the message does not name it. The
+        guard field on the second line keeps the document from ever validating.
+
+        Returns:
+            Tuple of (errors, truncated) where errors is a list of
+            (message, candidate index or None, whether the error had a location),
+            or None if the request failed
+        """
+        if self.abort_reason:
+            return None
+
+        keyword, path = self.types[type_name]['path']
+        lines = [PROBE_GUARD_FIELD]
+        lines += [f"{segment} {{" for segment in path]
+        lines += list(open_lines)
+        first_line = len(lines) + 2
+        lines += candidates
+        lines += list(close_lines)
+        lines += ["}"] * len(path)
+
+        # Indented so no token starts a line; some parsers misreport the line of column 1
+        body = "\n".join(f"  {line}" for line in lines)
+        data = self._post(f"{keyword} Probe{variables} {{\n{body}\n}}")
+        if data is None:
+            return None
+
+        errors = []
+        truncated = False
+        guarded = False
+        for error in data.get('errors') or []:
+            if not isinstance(error, dict):
+                continue
+            message = error.get('message') or ''
+            if PROBE_GUARD_FIELD in message:
+                guarded = True
+            if TOO_MANY_ERRORS in message:
+                truncated = True
+                continue
+            if not any(pattern.search(message) for pattern in KNOWN_ERROR_PATTERNS):
+                # Without understanding the errors every candidate would look valid
+                self.abort_reason = f"unrecognized validation error: {message!r}"
+                return None
+            index = None
+            locations = [location for location in error.get('locations') or [] if isinstance(location, dict)]
+            for location in locations:
+                line = location.get('line')
+                if line is not None and 0 <= line - first_line < len(candidates):
+                    index = line - first_line
+                    break
+            errors.append((message, index, bool(locations)))
+
+        if not guarded:
+            # The server doesn't validate documents, so further probes could run real mutations
+            self.abort_reason = "the server did not reject an invalid probe document"
+            return None
+        return errors, truncated
+
+    @staticmethod
+    def _suggestions(message):
+        match = SUGGESTION_RE.search(message)
+        if not match:
+            return []
+        return [name for name in QUOTED_NAME_RE.findall(match.group(1)) if not name.startswith('__')]
+
+    @staticmethod
+    def _required_args(message):
+        match = REQUIRED_ARGUMENT_RE.search(message)
+        if not match:
+            return None
+        field_name = match.group(1) or match.group(3)
+        arg_name = match.group(2) or match.group(4)
+        return field_name, arg_name, match.group(5)
+
+    @staticmethod
+    def _candidate_index(index, located, positions, name):
+        """Map an error to a candidate by its location, or by the name it mentions if it has none"""
+        if located:
+            return index
+        return positions.get(name)
+
+    @staticmethod
+    def _split_truncated(words, truncated, last_index):
+        """Words after the last reported error were never validated and must be retried"""
+        if not truncated:
+            return words, []
+        return words[:last_index + 1], words[last_index + 1:]
+
+    def _field_jobs(self):
+        jobs = []
+        for type_name, info in self.types.items():
+            probed = self._probed_fields.setdefault(type_name, set())
+            pending = [word for word in self.words if word not in probed and word not in info['fields']]
+            probed.update(pending)
+            for i in range(0, len(pending), self.batch_size):
+                jobs.append((self._discover_fields, (type_name, pending[i:i + self.batch_size]), self._merge_fields))
+        return jobs
+
+    def _discover_fields(self, type_name, words):
+        """Probe candidate field names as aliases on a type"""
+        probe = self._probe(type_name, [f"a{i}: {word}" for i, word in enumerate(words)])
+        if probe is None:
+            return None
+        errors, truncated = probe
+
+        positions = {word: i for i, word in enumerate(words)}
+        result = {'invalid': set(), 'suggestions': set(), 'types': {}, 'required': [], 'retry': []}
+        flagged = set()
+        confirmed = set()
+        last_index = -1
+
+        for message, index, located in errors:
+            match = UNKNOWN_FIELD_RE.search(message)
+            if match and match.group(2) == type_name:
+                result['invalid'].add(match.group(1))
+                result['suggestions'].update(self._suggestions(message))
+                index = positions.get(match.group(1), index)
+            else:
+                # Errors that only a real field can cause confirm the candidate they belong to
+                selection = SELECTION_REQUIRED_RE.search(message)
+                required = self._required_args(message)
+                name = selection.group(1) if selection else required[0] if required else None
+                if name:
+                    index = self._candidate_index(index, located, positions, name)
+                    if index is not None and words[index] == name:
+                        confirmed.add(name)
+                        if selection:
+                            result['types'][name] = selection.group(2)
+                        if required:
+                            result['required'].append(required)
+            if index is not None:
+                flagged.add(index)
+                last_index = max(last_index, index)
+
+        if truncated and last_index < 0:
+            return None
+        checked, result['retry'] = self._split_truncated(words, truncated, last_index)
+        # A name is real if nothing complained about its line, or if an error confirmed it
+        result['valid'] = [
+            word for i, word in enumerate(checked)
+            if word in confirmed or (i not in flagged and word not in result['invalid'])
+        ]
+        return result
+
+    def _merge_fields(self, result, type_name, words):
+        for field_name in result['valid']:
+            self._add_field(type_name, field_name)
+        for field_name in result['suggestions']:
+            self._add_field(type_name, field_name)
+        self._add_words(result['suggestions'])
+        for field_name, field_type in result['types'].items():
+            self._set_field_type(type_name, field_name, field_type, True)
+        for field_name, arg_name, arg_type in result['required']:
+            if field_name in self.types[type_name]['fields']:
+                self.types[type_name]['fields'][field_name]['args'][arg_name] = arg_type
+        # Names past the error limit were never validated
+        if result['retry']:
+            return [(self._discover_fields, (type_name, result['retry']), self._merge_fields)]
+        return []
+
+    def _field_type_jobs(self):
+        jobs = []
+        for type_name, info in self.types.items():
+            pending = [
+                field_name for field_name, field in info['fields'].items()
+                if field['type'] is None and self._type_attempts[(type_name, field_name)] < RECOVERY_TYPE_ATTEMPTS
+            ]
+            for field_name in pending:
+                self._type_attempts[(type_name, field_name)] += 1
+            for i in range(0, len(pending), RECOVERY_TYPE_BATCH_SIZE):
+                batch = pending[i:i + RECOVERY_TYPE_BATCH_SIZE]
+                jobs.append((self._discover_field_types, (type_name, batch), self._merge_field_types))
+        return jobs
+
+    def _discover_field_types(self, type_name, fields):
+        """Select each field with and without a sub-selection; whichever is wrong names the type"""
+        candidates = []
+        for i, field_name in enumerate(fields):
+            candidates.append(f"a{i}: {field_name}")
+            candidates.append(f"b{i}: {field_name} {{ __typename }}")
+        probe = self._probe(type_name, candidates)
+        if probe is None:
+            return None
+        errors, truncated = probe
+
+        positions = {field_name: i * 2 for i, field_name in enumerate(fields)}
+        result = {'types': {}, 'required': []}
+        for message, index, located in errors:
+            selection = SELECTION_REQUIRED_RE.search(message)
+            no_selection = NO_SELECTION_RE.search(message)
+            required = self._required_args(message)
+            match = selection or no_selection
+            name = match.group(1) if match else required[0] if required else None
+            if not name:
+                continue
+            # Ignore errors raised by the fields on the path to this type
+            index = self._candidate_index(index, located, positions, name)
+            if index is None or fields[index // 2] != name:
+                continue
+            if match:
+                result['types'][name] = (match.group(2), bool(selection))
+            if required:
+                result['required'].append(required)
+        return result
+
+    def _merge_field_types(self, result, type_name, fields):
+        for field_name, (field_type, is_object) in result['types'].items():
+            if field_name in self.types[type_name]['fields']:
+                self._set_field_type(type_name, field_name, field_type, is_object)
+        for field_name, arg_name, arg_type in result['required']:
+            if field_name in self.types[type_name]['fields']:
+                self.types[type_name]['fields'][field_name]['args'][arg_name] = arg_type
+
+    def _arg_jobs(self):
+        jobs = []
+        for type_name, info in self.types.items():
+            for field_name, field in info['fields'].items():
+                # The field type decides whether the probe needs a sub-selection
+                if field['type'] is None:
+                    continue
+                probed = self._probed_args.setdefault((type_name, field_name), set())
+                pending = [word for word in self.words if word not in probed and word not in field['args']]
+                probed.update(pending)
+                for i in range(0, len(pending), self.batch_size):
+                    batch = pending[i:i + self.batch_size]
+                    jobs.append((self._discover_args, (type_name, field_name, batch), self._merge_args))
+        return jobs
+
+    def _discover_args(self, type_name, field_name, words):
+        """Pass candidate argument names as null literals to a field"""
+        field = self.types[type_name]['fields'][field_name]
+        selection = " { __typename }" if field['object'] else ""
+        probe = self._probe(
+            type_name,
+            [f"{word}: null" for word in words],
+            open_lines=[f"{field_name}("],
+            close_lines=[f"){selection}"]
+        )
+        if probe is None:
+            return None
+        errors, truncated = probe
+
+        positions = {word: i for i, word in enumerate(words)}
+        result = {'invalid': set(), 'suggestions': set(), 'types': {}, 'retry': []}
+        flagged = set()
+        last_index = -1
+
+        for message, index, located in errors:
+            match = UNKNOWN_ARGUMENT_RE.search(message)
+            if match:
+                if match.group(2) == field_name:
+                    result['invalid'].add(match.group(1))
+                    result['suggestions'].update(self._suggestions(message))
+                    index = positions.get(match.group(1), index)
+            else:
+                # Null passed to a non-null argument reports the argument type
+                match = EXPECTED_TYPE_RE.search(message)
+                if match and located and index is not None:
+                    result['types'][words[index]] = match.group(1)
+                required = self._required_args(message)
+                if required and required[0] == field_name:
+                    result['types'][required[1]] = required[2]
+            if index is not None:
+                flagged.add(index)
+                last_index = max(last_index, index)
+
+        if truncated and last_index < 0:
+            return None
+        checked, result['retry'] = self._split_truncated(words, truncated, last_index)
+        # A name is real if nothing complained about its line, or if an error reported its type
+        result['valid'] = [
+            word for i, word in enumerate(checked)
+            if word in result['types'] or (i not in flagged and word not in result['invalid'])
+        ]
+        return result
+
+    def _merge_args(self, result, type_name, field_name, words):
+        args = self.types[type_name]['fields'][field_name]['args']
+        for arg_name in list(result['valid']) + list(result['suggestions']):
+            args.setdefault(arg_name, None)
+        for arg_name, arg_type in result['types'].items():
+            args[arg_name] = arg_type
+        self._add_words(result['suggestions'])
+        if result['retry']:
+            return [(self._discover_args, (type_name, field_name, result['retry']), self._merge_args)]
+        return []
+
+    def _arg_type_jobs(self):
+        jobs = []
+        for type_name, info in self.types.items():
+            for field_name, field in info['fields'].items():
+                pending = [
+                    arg_name for arg_name, arg_type in field['args'].items()
+                    if arg_type is None and (type_name, field_name, arg_name) not in self._arg_type_attempted
+                ]
+                self._arg_type_attempted.update((type_name, field_name, arg_name) for arg_name in pending)
+                for i in range(0, len(pending), RECOVERY_TYPE_BATCH_SIZE):
+                    batch = pending[i:i + RECOVERY_TYPE_BATCH_SIZE]
+                    jobs.append((self._discover_arg_types, (type_name, field_name, batch), self._merge_arg_types))
+        return jobs
+
+    def _discover_arg_types(self, type_name, field_name, args):
+        """Bind each argument to a Boolean variable; a mismatch names the expected type"""
+        field = self.types[type_name]['fields'][field_name]
+        selection = " { __typename }" if field['object'] else ""
+        variables = "(" + ", ".join(f"$v{i}: Boolean" for i in range(len(args))) + ")"
+        probe = self._probe(
+            type_name,
+            [f"{arg_name}: $v{i}" for i, arg_name in enumerate(args)],
+            variables=variables,
+            open_lines=[f"{field_name}("],
+            close_lines=[f"){selection}"]
+        )
+        if probe is None:
+            return None
+        errors, truncated = probe
+        if truncated:
+            return None
+
+        types = {}
+        flagged = set()
+        for message, index, located in errors:
+            match = VARIABLE_TYPE_RE.search(message)
+            if match and int(match.group(1)) < len(args):
+                types[args[int(match.group(1))]] = match.group(2)
+            elif index is not None:
+                flagged.add(args[index])
+        # No complaint about its line means the argument really is a nullable Boolean
+        return {
+            arg_name: types.get(arg_name, None if arg_name in flagged else 'Boolean')
+            for arg_name in args
+        }
+
+    def _merge_arg_types(self, result, type_name, field_name, args):
+        self.types[type_name]['fields'][field_name]['args'].update(result)
+
+def load_wordlist(filename):
+    """
+    Load candidate names from a wordlist file, one per line
+    
+    Args:
+        filename: Path to wordlist file
+    
+    Returns:
+        List of words or None if failed
+    """
+    try:
+        with open(filename, 'r') as f:
+            words = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+        print(f"{Colors.OKGREEN}[+] Loaded {len(words)} words from {filename}{Colors.ENDC}")
+        return words
+    except FileNotFoundError:
+        print(f"{Colors.FAIL}[!] File not found: {filename}{Colors.ENDC}")
+        return None
+    except Exception as e:
+        print(f"{Colors.FAIL}[!] Failed to load wordlist: {e}{Colors.ENDC}")
+        return None
+
+def recover_schema(url, wordlist, proxy=None, delay=0, batch_size=RECOVERY_BATCH_SIZE, threads=RECOVERY_THREADS):
+    """
+    Recover the GraphQL schema from "Did you mean" suggestions and validation errors
+    
+    Args:
+        url: Target GraphQL endpoint URL
+        wordlist: List of candidate field and argument names
+        proxy: Proxy configuration (optional)
+        delay: Delay between requests in seconds, per thread
+        batch_size: Candidate names per request
+        threads: Number of parallel requests
+    
+    Returns:
+        Schema data dictionary or None if failed
+    """
+    print(f"{Colors.OKBLUE}[*] Recovering schema from field suggestions "
+          f"({batch_size} names per request, {threads} threads)...{Colors.ENDC}")
+    
+    recovery = SchemaRecovery(url, wordlist, proxy, delay, batch_size, threads)
+    schema = recovery.run()
+    
+    if not schema:
+        print(f"{Colors.FAIL}[!] Failed to recover schema{Colors.ENDC}")
+        return None
+    
+    field_count = sum(len(info['fields']) for info in recovery.types.values())
+    print(f"{Colors.OKGREEN}[+] Recovered {len(recovery.types)} types and {field_count} fields "
+          f"in {recovery.requests_sent} requests{Colors.ENDC}")
+    return schema
+
 def extract_queries_mutations(schema):
     """
     Extract all queries and mutations from the schema
@@ -281,8 +1255,8 @@ def extract_queries_mutations(schema):
     queries = []
     mutations = []
     
-    query_type_name = schema.get('queryType', {}).get('name')
-    mutation_type_name = schema.get('mutationType', {}).get('name')
+    query_type_name = (schema.get('queryType') or {}).get('name')
+    mutation_type_name = (schema.get('mutationType') or {}).get('name')
     
     for type_info in schema.get('types', []):
         type_name = type_info.get('name')
@@ -335,6 +1309,23 @@ def get_type_name(type_obj):
     else:
         return "Unknown"
 
+def parse_type_name(type_name, kinds=None):
+    """
+    Parse a type string such as "[User!]!" into a type object
+    
+    Args:
+        type_name: String representation of the type
+        kinds: Dictionary of named type kinds (optional, defaults to SCALAR)
+    
+    Returns:
+        GraphQL type object in introspection format
+    """
+    if type_name.endswith('!'):
+        return {'kind': 'NON_NULL', 'name': None, 'ofType': parse_type_name(type_name[:-1], kinds)}
+    if type_name.startswith('[') and type_name.endswith(']'):
+        return {'kind': 'LIST', 'name': None, 'ofType': parse_type_name(type_name[1:-1], kinds)}
+    return {'kind': (kinds or {}).get(type_name, 'SCALAR'), 'name': type_name, 'ofType': None}
+
 def generate_mock_value(type_obj, schema):
     """
     Generate a mock value based on the GraphQL type
@@ -413,7 +1404,7 @@ def build_graphql_operation(name, args, operation_type='query'):
     
     return operation.strip(), variables
 
-def execute_operation(url, operation, variables, proxy=None, delay=0.5):
+def execute_operation(url, operation, variables, proxy=None, delay=0.5, verbose=True):
     """
     Execute a GraphQL operation
     
@@ -423,19 +1414,49 @@ def execute_operation(url, operation, variables, proxy=None, delay=0.5):
         variables: Variables dictionary
         proxy: Proxy configuration
         delay: Delay between requests in seconds
+        verbose: Print request errors
     
     Returns:
         Response data or None
     """
-    headers = {
-        'Content-Type': 'application/json',
-        'User-Agent': 'GraphQL-Introspection-Tool/1.0'
-    }
+    body = encode_operation_body(operation, variables)
+    return execute_prepared_operation(url, body, proxy, delay, verbose)
+
+def encode_operation_body(operation, variables):
+    """
+    Serialize a GraphQL operation into a request body
     
+    Args:
+        operation: GraphQL operation string
+        variables: Variables dictionary
+    
+    Returns:
+        JSON request body as bytes
+    """
     payload = {
         'query': operation,
         'variables': variables
     }
+    return json.dumps(payload, allow_nan=False).encode('utf-8')
+
+def execute_prepared_operation(url, body, proxy=None, delay=0.5, verbose=True):
+    """
+    Execute a pre-serialized GraphQL operation
+    
+    Args:
+        url: Target GraphQL endpoint URL
+        body: JSON request body as bytes
+        proxy: Proxy configuration
+        delay: Delay between requests in seconds
+        verbose: Print request errors
+    
+    Returns:
+        Response data or None
+    """
+    headers = {
+        'Content-Type': 'application/json',
+        'User-Agent': 'GraphQL-Introspection-Tool/1.0'
+    }
     
     proxies = None
     verify_ssl = True
@@ -449,115 +1470,349 @@ def execute_operation(url, operation, variables, proxy=None, delay=0.5):
         verify_ssl = False
     
     try:
-        time.sleep(delay)  # Rate limiting
+        with phase('delay'):
+            time.sleep(delay)  # Rate limiting
         
         # Suppress SSL warnings when verification is disabled
         if not verify_ssl:
             import urllib3
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
         
-        response = requests.post(
-            url,
-            json=payload,
-            headers=headers,
-            proxies=proxies,
-            timeout=30,
-            verify=verify_ssl
-        )
+        with phase('network'):
+            response = requests.post(
+                url,
+                data=body,
+                headers=headers,
+                proxies=proxies,
+                timeout=30,
+                verify=verify_ssl
+            )
         return response
     except requests.exceptions.RequestException as e:
-        print(f"{Colors.FAIL}[!] Error: {e}{Colors.ENDC}")
+        if verbose:
+            print(f"{Colors.FAIL}[!] Error: {e}{Colors.ENDC}")
         return None
 
-def send_all_operations(url, queries, mutations, proxy=None, delay=0.5, pause=False):
+def plan_cache_key(queries, mutations):
     """
-    Send all queries and mutations to the endpoint
+    Build the cache key for an operation plan
+    
+    Only the root operations feed the plan, so the key covers their names and
+    argument types rather than the whole schema, which keeps a cache hit
+    cheaper than compiling the plan.
+    
+    Args:
+        queries: List of query definitions
+        mutations: List of mutation definitions
+    
+    Returns:
+        Hex digest string
+    """
+    operations = [
+        [operation_type, op['name'], [[arg['name'], get_type_name(arg['type'])] for arg in op['args']]]
+        for operation_type, ops in (('query', queries), ('mutation', mutations))
+        for op in ops
+    ]
+    key = {
+        'format': PLAN_FORMAT_VERSION,
+        'operations': operations
+    }
+    return hashlib.sha256(json.dumps(key, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+def compile_operation_plan(queries, mutations):
+    """
+    Compile queries and mutations into ready-to-send request bodies
     
     Args:
-        url: Target GraphQL endpoint URL
         queries: List of query definitions
         mutations: List of mutation definitions
+    
+    Returns:
+        List of plan entries with 'type', 'name' and 'body' (bytes) keys
+    """
+    plan = []
+    
+    for operation_type, operations in (('query', queries), ('mutation', mutations)):
+        for op in operations:
+            operation, variables = build_graphql_operation(op['name'], op['args'], operation_type)
+            plan.append({
+                'type': operation_type,
+                'name': op['name'],
+                'body': encode_operation_body(operation, variables)
+            })
+    
+    return plan
+
+def load_operation_plan(cache_dir, key):
+    """
+    Load a cached operation plan
+    
+    Args:
+        cache_dir: Plan cache directory
+        key: Cache key from plan_cache_key()
+    
+    Returns:
+        Plan list or None if not cached
+    """
+    path = os.path.join(cache_dir, f"{key}.json")
+    
+    try:
+        with open(path, 'r') as f:
+            entries = json.load(f)
+        return [
+            {'type': entry['type'], 'name': entry['name'], 'body': entry['body'].encode('utf-8')}
+            for entry in entries
+        ]
+    except FileNotFoundError:
+        return None
+    except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+        print(f"{Colors.WARNING}[!] Ignoring corrupt plan cache entry: {path}{Colors.ENDC}")
+        return None
+
+def save_operation_plan(plan, cache_dir, key):
+    """
+    Save an operation plan to the cache
+    
+    Args:
+        plan: Plan list from compile_operation_plan()
+        cache_dir: Plan cache directory
+        key: Cache key from plan_cache_key()
+    """
+    path = os.path.join(cache_dir, f"{key}.json")
+    entries = [
+        {'type': entry['type'], 'name': entry['name'], 'body': entry['body'].decode('utf-8')}
+        for entry in plan
+    ]
+    
+    # Write to a temporary file first so concurrent runs never read a partial plan
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp_path, 'w') as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, path)
+        print(f"{Colors.OKGREEN}[+] Operation plan cached to {path}{Colors.ENDC}")
+    except Exception as e:
+        print(f"{Colors.WARNING}[!] Failed to save operation plan: {e}{Colors.ENDC}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def get_operation_plan(schema, cache_dir=None):
+    """
+    Get the operation plan for a schema, compiling it on a cache miss
+    
+    Args:
+        schema: GraphQL schema dictionary
+        cache_dir: Plan cache directory, or None to disable caching
+    
+    Returns:
+        Plan list
+    """
+    key = None
+    
+    print(f"\n{Colors.OKBLUE}[*] Extracting queries and mutations...{Colors.ENDC}")
+    with phase('extract'):
+        queries, mutations = extract_queries_mutations(schema)
+    
+    if cache_dir:
+        with phase('plan_load'):
+            key = plan_cache_key(queries, mutations)
+            plan = load_operation_plan(cache_dir, key)
+        
+        if plan is not None:
+            print(f"{Colors.OKGREEN}[+] Loaded cached operation plan from {os.path.join(cache_dir, key + '.json')}{Colors.ENDC}")
+            return plan
+    
+    with phase('plan_compile'):
+        plan = compile_operation_plan(queries, mutations)
+    
+    if cache_dir:
+        with phase('plan_save'):
+            save_operation_plan(plan, cache_dir, key)
+    
+    return plan
+
+def classify_result(response, result_data=None):
+    """
+    Classify the outcome of an operation for the progress view
+    
+    Args:
+        response: Response object or None if the request failed
+        result_data: Decoded response body (optional)
+    
+    Returns:
+        Error class string, or None if the operation succeeded
+    """
+    if response is None:
+        return 'Request failed'
+    if response.status_code != 200:
+        return f'HTTP {response.status_code}'
+    if result_data is None:
+        return 'Invalid JSON'
+    if not isinstance(result_data, dict):
+        return 'Unexpected response'
+    if result_data.get('errors'):
+        error = first_graphql_error(result_data)
+        code = (error.get('extensions') or {}).get('code') if isinstance(error, dict) else None
+        return f'GraphQL {code}' if code else 'GraphQL error'
+    return None
+
+def first_graphql_error(result_data):
+    """
+    Get the first entry of a response's errors list
+    
+    Args:
+        result_data: Decoded response body, which may not be a JSON object
+    
+    Returns:
+        First error entry or None if there is none
+    """
+    if not isinstance(result_data, dict):
+        return None
+    errors = result_data.get('errors')
+    if isinstance(errors, list) and errors:
+        return errors[0]
+    return None
+
+def send_operations(url, plan, operation_type, results, proxy=None, delay=0.5, pause=False,
+                    verbose=True, tracker=None):
+    """
+    Send the plan entries of one operation type to the endpoint
+    
+    Args:
+        url: Target GraphQL endpoint URL
+        plan: List of plan entries
+        operation_type: 'query' or 'mutation'
+        results: List to append successful results to
         proxy: Proxy configuration
         delay: Delay between requests
         pause: Pause and wait for Enter before each request
+        verbose: Print per-request output
+        tracker: ProgressTracker to update after each request (optional)
     """
-    results = {
-        'queries': [],
-        'mutations': []
-    }
+    entries = [entry for entry in plan if entry['type'] == operation_type]
     
-    print(f"\n{Colors.HEADER}{Colors.BOLD}=== SENDING QUERIES ==={Colors.ENDC}")
-    print(f"{Colors.OKCYAN}Sending {len(queries)} queries...{Colors.ENDC}\n")
-    
-    for i, query in enumerate(queries, 1):
-        print(f"{Colors.OKBLUE}[{i}/{len(queries)}] Executing query: {query['name']}{Colors.ENDC}")
+    for i, entry in enumerate(entries, 1):
+        if verbose:
+            print(f"{Colors.OKBLUE}[{i}/{len(entries)}] Executing {operation_type}: {entry['name']}{Colors.ENDC}")
         
         if pause:
             input(f"{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
         
-        operation, variables = build_graphql_operation(query['name'], query['args'], 'query')
-        
-        response = execute_operation(url, operation, variables, proxy, delay)
+        started = time.perf_counter()
+        response = execute_prepared_operation(url, entry['body'], proxy, delay, verbose)
+        result_data = None
         
         if response:
             try:
-                result_data = response.json()
-                status = f"{Colors.OKGREEN}✓ Success{Colors.ENDC}" if response.status_code == 200 else f"{Colors.WARNING}⚠ Status {response.status_code}{Colors.ENDC}"
-                print(f"    Status: {status}")
+                with phase('response_decode'):
+                    result_data = response.json()
                 
-                if 'errors' in result_data:
-                    print(f"    {Colors.WARNING}Errors: {result_data['errors'][0].get('message', 'Unknown error')}{Colors.ENDC}")
-                elif 'data' in result_data:
-                    print(f"    {Colors.OKGREEN}Data received{Colors.ENDC}")
+                if verbose:
+                    with phase('print'):
+                        status = f"{Colors.OKGREEN}✓ Success{Colors.ENDC}" if response.status_code == 200 else f"{Colors.WARNING}⚠ Status {response.status_code}{Colors.ENDC}"
+                        print(f"    Status: {status}")
+                        
+                        error = first_graphql_error(result_data)
+                        if error is not None:
+                            message = error.get('message', 'Unknown error') if isinstance(error, dict) else error
+                            print(f"    {Colors.WARNING}Errors: {message}{Colors.ENDC}")
+                        elif isinstance(result_data, dict) and 'data' in result_data:
+                            print(f"    {Colors.OKGREEN}Data received{Colors.ENDC}")
+                        else:
+                            print(f"    {Colors.WARNING}Unexpected response{Colors.ENDC}")
                 
-                results['queries'].append({
-                    'name': query['name'],
+                results.append({
+                    'name': entry['name'],
                     'status_code': response.status_code,
                     'response': result_data
                 })
             except json.JSONDecodeError:
-                print(f"    {Colors.FAIL}Failed to parse response{Colors.ENDC}")
-        else:
+                if verbose:
+                    print(f"    {Colors.FAIL}Failed to parse response{Colors.ENDC}")
+        elif verbose:
             print(f"    {Colors.FAIL}✗ Failed{Colors.ENDC}")
-        print()
+        
+        if tracker:
+            # Prefer the server round-trip time so the rate limit delay doesn't skew the slowest list
+            elapsed = response.elapsed.total_seconds() if response is not None else time.perf_counter() - started
+            tracker.record(f"{operation_type} {entry['name']}", elapsed, classify_result(response, result_data))
+        
+        if verbose:
+            print()
+
+def send_operation_plan(url, plan, proxy=None, delay=0.5, pause=False, verbose=True):
+    """
+    Send every entry of an operation plan to the endpoint
     
-    print(f"\n{Colors.HEADER}{Colors.BOLD}=== SENDING MUTATIONS ==={Colors.ENDC}")
-    print(f"{Colors.OKCYAN}Sending {len(mutations)} mutations...{Colors.ENDC}\n")
+    Args:
+        url: Target GraphQL endpoint URL
+        plan: List of plan entries from compile_operation_plan()
+        proxy: Proxy configuration
+        delay: Delay between requests
+        pause: Pause and wait for Enter before each request
+        verbose: Print per-request output instead of the live progress view
     
-    for i, mutation in enumerate(mutations, 1):
-        print(f"{Colors.OKBLUE}[{i}/{len(mutations)}] Executing mutation: {mutation['name']}{Colors.ENDC}")
-        
-        if pause:
-            input(f"{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+    Returns:
+        Results dictionary with 'queries' and 'mutations' lists
+    """
+    results = {
+        'queries': [],
+        'mutations': []
+    }
+    
+    query_count = sum(1 for entry in plan if entry['type'] == 'query')
+    mutation_count = len(plan) - query_count
+    
+    # Pausing needs the prompt on screen, so it always uses per-request output
+    verbose = verbose or pause
+    tracker = None
+    renderer = None
+    
+    if not verbose:
+        tracker = ProgressTracker(len(plan))
+        renderer = ProgressRenderer(tracker)
+        print(f"\n{Colors.HEADER}{Colors.BOLD}=== SENDING OPERATIONS ==={Colors.ENDC}")
+        print(f"{Colors.OKCYAN}Sending {query_count} queries and {mutation_count} mutations...{Colors.ENDC}\n")
+        renderer.start()
+    
+    try:
+        if verbose:
+            print(f"\n{Colors.HEADER}{Colors.BOLD}=== SENDING QUERIES ==={Colors.ENDC}")
+            print(f"{Colors.OKCYAN}Sending {query_count} queries...{Colors.ENDC}\n")
         
-        operation, variables = build_graphql_operation(mutation['name'], mutation['args'], 'mutation')
+        send_operations(url, plan, 'query', results['queries'], proxy, delay, pause, verbose, tracker)
         
-        response = execute_operation(url, operation, variables, proxy, delay)
+        if verbose:
+            print(f"\n{Colors.HEADER}{Colors.BOLD}=== SENDING MUTATIONS ==={Colors.ENDC}")
+            print(f"{Colors.OKCYAN}Sending {mutation_count} mutations...{Colors.ENDC}\n")
         
-        if response:
-            try:
-                result_data = response.json()
-                status = f"{Colors.OKGREEN}✓ Success{Colors.ENDC}" if response.status_code == 200 else f"{Colors.WARNING}⚠ Status {response.status_code}{Colors.ENDC}"
-                print(f"    Status: {status}")
-                
-                if 'errors' in result_data:
-                    print(f"    {Colors.WARNING}Errors: {result_data['errors'][0].get('message', 'Unknown error')}{Colors.ENDC}")
-                elif 'data' in result_data:
-                    print(f"    {Colors.OKGREEN}Data received{Colors.ENDC}")
-                
-                results['mutations'].append({
-                    'name': mutation['name'],
-                    'status_code': response.status_code,
-                    'response': result_data
-                })
-            except json.JSONDecodeError:
-                print(f"    {Colors.FAIL}Failed to parse response{Colors.ENDC}")
-        else:
-            print(f"    {Colors.FAIL}✗ Failed{Colors.ENDC}")
-        print()
+        send_operations(url, plan, 'mutation', results['mutations'], proxy, delay, pause, verbose, tracker)
+    finally:
+        if renderer:
+            renderer.stop()
     
     return results
 
+def send_all_operations(url, queries, mutations, proxy=None, delay=0.5, pause=False, verbose=True):
+    """
+    Send all queries and mutations to the endpoint
+    
+    Args:
+        url: Target GraphQL endpoint URL
+        queries: List of query definitions
+        mutations: List of mutation definitions
+        proxy: Proxy configuration
+        delay: Delay between requests
+        pause: Pause and wait for Enter before each request
+        verbose: Print per-request output instead of the live progress view
+    """
+    with phase('plan_compile'):
+        plan = compile_operation_plan(queries, mutations)
+    
+    return send_operation_plan(url, plan, proxy, delay, pause, verbose)
+
 def load_schema_from_file(filename):
     """
     Load schema from a JSON file
@@ -613,6 +1868,89 @@ def save_results_to_file(results, filename='graphql_results.json'):
     except Exception as e:
         print(f"{Colors.FAIL}[!] Failed to save results: {e}{Colors.ENDC}")
 
+def run_workflow(args, proxy=None):
+    """
+    Retrieve the schema and execute operations according to the parsed arguments
+    
+    Args:
+        args: Parsed command-line arguments
+        proxy: Proxy configuration (optional)
+    """
+    # Determine workflow based on flags
+    schema = None
+    need_to_query = args.query is not False and args.query is not None
+    
+    # If -q is provided with a file path, load schema from file
+    if need_to_query and isinstance(args.query, str):
+        print(f"{Colors.OKBLUE}[*] Loading schema from file: {args.query}{Colors.ENDC}")
+        with phase('schema_load'):
+            schema = load_schema_from_file(args.query)
+        
+        if not schema:
+            print(f"{Colors.FAIL}[!] Failed to load schema from file. Cannot proceed.{Colors.ENDC}")
+            sys.exit(1)
+    else:
+        # Otherwise, check introspection and retrieve schema from URL
+        with phase('introspection_check'):
+            is_enabled = check_introspection(args.url, proxy)
+        
+        if not is_enabled and not args.wordlist:
+            print(f"\n{Colors.FAIL}[!] Introspection is disabled. Cannot proceed.{Colors.ENDC}")
+            print(f"{Colors.WARNING}[!] Use -w WORDLIST to attempt schema recovery from field suggestions{Colors.ENDC}")
+            sys.exit(1)
+        
+        if is_enabled:
+            with phase('schema_fetch'):
+                schema = get_full_schema(args.url, proxy)
+        else:
+            wordlist = load_wordlist(args.wordlist)
+            
+            if not wordlist:
+                print(f"{Colors.FAIL}[!] Failed to load wordlist. Cannot proceed.{Colors.ENDC}")
+                sys.exit(1)
+            
+            with phase('schema_recovery'):
+                schema = recover_schema(args.url, wordlist, proxy, args.delay, args.batch_size, args.threads)
+        
+        if not schema:
+            print(f"{Colors.FAIL}[!] Failed to retrieve schema. Cannot proceed.{Colors.ENDC}")
+            sys.exit(1)
+        
+        # Save schema if -s flag is provided
+        if args.schema:
+            print(f"\n{Colors.OKBLUE}[*] Saving schema to file...{Colors.ENDC}")
+            with phase('schema_save'):
+                save_schema_to_file(schema, args.schema)
+    
+    # Execute queries and mutations if -q flag is used
+    if need_to_query:
+        # Build (or load the cached) ready-to-send operation plan
+        plan = get_operation_plan(schema, args.plan_cache)
+        
+        query_count = sum(1 for entry in plan if entry['type'] == 'query')
+        mutation_count = len(plan) - query_count
+        print(f"{Colors.OKGREEN}[+] Found {query_count} queries and {mutation_count} mutations{Colors.ENDC}")
+        
+        if not plan:
+            print(f"{Colors.WARNING}[!] No queries or mutations found in schema{Colors.ENDC}")
+            sys.exit(0)
+        
+        # Send all queries and mutations
+        with phase('send_all'):
+            results = send_operation_plan(args.url, plan, proxy, args.delay, args.pause, args.verbose)
+        
+        # Summary
+        print(f"\n{Colors.HEADER}{Colors.BOLD}=== SUMMARY ==={Colors.ENDC}")
+        print(f"{Colors.OKGREEN}Queries executed: {len(results['queries'])}/{query_count}{Colors.ENDC}")
+        print(f"{Colors.OKGREEN}Mutations executed: {len(results['mutations'])}/{mutation_count}{Colors.ENDC}")
+        
+        # Save results if requested
+        if args.output:
+            with phase('save_results'):
+                save_results_to_file(results, args.output)
+    elif not args.schema:
+        print(f"\n{Colors.WARNING}[!] Use -s to save schema and/or -q [schema_file] to execute queries/mutations{Colors.ENDC}")
+
 def main():
     parser = argparse.ArgumentParser(
         description='GraphQL Introspection & Auto-Query Tool - Automatically execute all queries and mutations',
@@ -655,7 +1993,23 @@ def main():
     parser.add_argument('-d', '--delay', type=float, default=0.5,
                        help='Delay between requests in seconds (default: 0.5)')
     parser.add_argument('--pause', action='store_true',
-                       help='Pause and wait for Enter key press before each request')
+                       help='Pause and wait for Enter key press before each request (implies --verbose)')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                       help='Print per-request output instead of the live progress view')
+    parser.add_argument('-w', '--wordlist', metavar='FILE',
+                       help='Recover the schema from field suggestions using this wordlist when introspection is disabled')
+    parser.add_argument('--batch-size', type=int, default=RECOVERY_BATCH_SIZE,
+                       help=f'Candidate names per schema recovery request (default: {RECOVERY_BATCH_SIZE})')
+    parser.add_argument('-t', '--threads', type=int, default=RECOVERY_THREADS,
+                       help=f'Parallel requests during schema recovery (default: {RECOVERY_THREADS})')
+    parser.add_argument('--plan-cache', nargs='?', const=DEFAULT_PLAN_CACHE_DIR, metavar='DIR',
+                       help=f'Cache operation plans on disk (default: {DEFAULT_PLAN_CACHE_DIR}). Optionally specify a custom directory')
+    parser.add_argument('--profile', action='store_true',
+                       help='Time each phase of the run and print a profile summary at the end')
+    parser.add_argument('--profile-output', metavar='FILE',
+                       help='Capture a cProfile of the run and write it to FILE (implies --profile)')
+    parser.add_argument('--trace-memory', action='store_true',
+                       help='Record approximate peak memory per main-thread phase with tracemalloc, Python 3.9+ (implies --profile)')
     
     args = parser.parse_args()
     
@@ -680,62 +2034,15 @@ def main():
     print(f"{Colors.OKBLUE}[*] Delay: {args.delay}s between requests{Colors.ENDC}")
     print()
     
-    # Determine workflow based on flags
-    schema = None
-    need_to_query = args.query is not False and args.query is not None
-    
-    # If -q is provided with a file path, load schema from file
-    if need_to_query and isinstance(args.query, str):
-        print(f"{Colors.OKBLUE}[*] Loading schema from file: {args.query}{Colors.ENDC}")
-        schema = load_schema_from_file(args.query)
-        
-        if not schema:
-            print(f"{Colors.FAIL}[!] Failed to load schema from file. Cannot proceed.{Colors.ENDC}")
-            sys.exit(1)
+    if args.profile or args.profile_output or args.trace_memory:
+        PROFILER.start(cprofile_output=args.profile_output, trace_memory=args.trace_memory)
+        try:
+            run_workflow(args, proxy)
+        finally:
+            PROFILER.stop()
+            PROFILER.report()
     else:
-        # Otherwise, check introspection and retrieve schema from URL
-        is_enabled = check_introspection(args.url, proxy)
-        
-        if not is_enabled:
-            print(f"\n{Colors.FAIL}[!] Introspection is disabled. Cannot proceed.{Colors.ENDC}")
-            sys.exit(1)
-        
-        schema = get_full_schema(args.url, proxy)
-        
-        if not schema:
-            print(f"{Colors.FAIL}[!] Failed to retrieve schema. Cannot proceed.{Colors.ENDC}")
-            sys.exit(1)
-        
-        # Save schema if -s flag is provided
-        if args.schema:
-            print(f"\n{Colors.OKBLUE}[*] Saving schema to file...{Colors.ENDC}")
-            save_schema_to_file(schema, args.schema)
-    
-    # Execute queries and mutations if -q flag is used
-    if need_to_query:
-        # Extract queries and mutations
-        print(f"\n{Colors.OKBLUE}[*] Extracting queries and mutations...{Colors.ENDC}")
-        queries, mutations = extract_queries_mutations(schema)
-        
-        print(f"{Colors.OKGREEN}[+] Found {len(queries)} queries and {len(mutations)} mutations{Colors.ENDC}")
-        
-        if len(queries) == 0 and len(mutations) == 0:
-            print(f"{Colors.WARNING}[!] No queries or mutations found in schema{Colors.ENDC}")
-            sys.exit(0)
-        
-        # Send all queries and mutations
-        results = send_all_operations(args.url, queries, mutations, proxy, args.delay, args.pause)
-        
-        # Summary
-        print(f"\n{Colors.HEADER}{Colors.BOLD}=== SUMMARY ==={Colors.ENDC}")
-        print(f"{Colors.OKGREEN}Queries executed: {len(results['queries'])}/{len(queries)}{Colors.ENDC}")
-        print(f"{Colors.OKGREEN}Mutations executed: {len(results['mutations'])}/{len(mutations)}{Colors.ENDC}")
-        
-        # Save results if requested
-        if args.output:
-            save_results_to_file(results, args.output)
-    elif not args.schema:
-        print(f"\n{Colors.WARNING}[!] Use -s to save schema and/or -q [schema_file] to execute queries/mutations{Colors.ENDC}")
+        run_workflow(args, proxy)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
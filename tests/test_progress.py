@@ -0,0 +1,89 @@
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import GQLXploer
+
+
+def response(status_code=200):
+    return SimpleNamespace(status_code=status_code)
+
+
+@pytest.mark.parametrize('result_data, expected', [
+    ([], 'Unexpected response'),
+    ('not an object', 'Unexpected response'),
+    ({'errors': ['msg']}, 'GraphQL error'),
+    ({'errors': 'msg'}, 'GraphQL error'),
+    ({'errors': [{'message': 'denied', 'extensions': {'code': 'FORBIDDEN'}}]}, 'GraphQL FORBIDDEN'),
+    ({'data': {'ok': True}}, None),
+    (None, 'Invalid JSON'),
+])
+def test_classify_result(result_data, expected):
+    assert GQLXploer.classify_result(response(), result_data) == expected
+
+
+def test_classify_result_request_and_status():
+    assert GQLXploer.classify_result(None) == 'Request failed'
+    assert GQLXploer.classify_result(response(500), []) == 'HTTP 500'
+
+
+def test_first_graphql_error():
+    assert GQLXploer.first_graphql_error([]) is None
+    assert GQLXploer.first_graphql_error({'errors': []}) is None
+    assert GQLXploer.first_graphql_error({'errors': ['msg']}) == 'msg'
+
+
+def test_tracker_keeps_slowest_operations():
+    tracker = GQLXploer.ProgressTracker(10)
+    for i, elapsed in enumerate([0.3, 0.1, 0.5, 0.2, 0.4]):
+        tracker.record(f"query op{i}", elapsed, 'HTTP 500' if i % 2 else None)
+
+    snap = tracker.snapshot()
+
+    assert snap['done'] == 5
+    assert snap['total'] == 10
+    assert snap['errors'] == {'HTTP 500': 2}
+    assert snap['slowest'] == [(0.5, 'query op2'), (0.4, 'query op4'), (0.3, 'query op0')]
+
+
+def test_tracker_eta_before_first_operation():
+    snap = GQLXploer.ProgressTracker(3).snapshot()
+
+    assert snap['done'] == 0
+    assert snap['eta'] is None
+
+
+def test_renderer_format():
+    snap = {
+        'done': 4,
+        'total': 8,
+        'elapsed': 2.0,
+        'rate': 2.0,
+        'eta': 2.0,
+        'errors': {'HTTP 500': 1, 'GraphQL error': 3},
+        'slowest': [(0.25, 'query slow'), (0.1, 'mutation fast')]
+    }
+
+    lines = GQLXploer.ProgressRenderer.format(snap)
+
+    assert '[4/8]' in lines[0]
+    assert '2.0 req/s' in lines[0]
+    assert 'ETA 2s' in lines[0]
+    assert 'errors 4' in lines[0]
+    assert 'GraphQL error: 3' in lines[1]
+    assert 'HTTP 500: 1' in lines[2]
+    assert lines[-2].endswith('query slow')
+    assert lines[-1].endswith('mutation fast')
+
+
+def test_renderer_format_without_eta():
+    snap = {'done': 0, 'total': 3, 'elapsed': 0.0, 'rate': 0.0, 'eta': None, 'errors': {}, 'slowest': []}
+
+    lines = GQLXploer.ProgressRenderer.format(snap)
+
+    assert lines == [lines[0]]
+    assert 'ETA -' in lines[0]
@@ -0,0 +1,121 @@
+import os
+import re
+import sys
+
+import pytest
+
+graphql = pytest.importorskip('graphql')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import GQLXploer
+
+SDL = """
+type Query {
+  user(id: ID!): User
+  users(first: Int): [User!]!
+  version: String
+}
+
+type Mutation {
+  resetAll(confirm: Boolean): Boolean
+  ping: Boolean
+  deleteUser(id: ID!): Boolean
+}
+
+type User {
+  id: ID!
+  name: String
+}
+"""
+
+WORDLIST = ['user', 'users', 'version', 'resetAll', 'ping', 'deleteUser', 'id', 'name', 'first',
+            'confirm', 'foo', 'bar', 'baz', 'qux']
+
+
+class FakeServer:
+    """graphql-core backed stand-in for the HTTP endpoint"""
+
+    def __init__(self):
+        self.schema = graphql.build_schema(SDL)
+        self.executed = []
+        self.valid_documents = []
+
+        def resolver(name):
+            def resolve(root, info, **kwargs):
+                self.executed.append(name)
+                return True
+            return resolve
+
+        for name, field in self.schema.mutation_type.fields.items():
+            field.resolve = resolver(name)
+
+    def post(self, document):
+        errors = graphql.validate(self.schema, graphql.parse(document))
+        if errors:
+            return {'errors': [error.formatted for error in errors]}
+        self.valid_documents.append(document)
+        result = graphql.execute(self.schema, graphql.parse(document))
+        return {'data': result.data}
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = FakeServer()
+    monkeypatch.setattr(GQLXploer.SchemaRecovery, '_post', lambda self, document: server.post(document))
+    return server
+
+
+def test_probes_never_validate(server):
+    schema = GQLXploer.recover_schema('http://target/graphql', WORDLIST, threads=2)
+
+    assert server.valid_documents == []
+    assert server.executed == []
+
+    mutation = next(t for t in schema['types'] if t['name'] == schema['mutationType']['name'])
+    assert {field['name'] for field in mutation['fields']} == {'resetAll', 'ping', 'deleteUser'}
+
+
+def graphql_java_wording(message):
+    return re.sub(r"Cannot query field '(\w+)' on type '(\w+)'\.", r"Field '\1' in type '\2' is undefined", message)
+
+
+@pytest.mark.parametrize('keep_guard', [False, True])
+def test_unrecognized_errors_stop_recovery(server, monkeypatch, keep_guard):
+    def post(self, document):
+        data = server.post(document)
+        for error in data.get('errors', []):
+            if not (keep_guard and GQLXploer.PROBE_GUARD_FIELD in error['message']):
+                error['message'] = graphql_java_wording(error['message'])
+        return data
+
+    monkeypatch.setattr(GQLXploer.SchemaRecovery, '_post', post)
+
+    recovery = GQLXploer.SchemaRecovery('http://target/graphql', WORDLIST, threads=2)
+
+    assert recovery.run() is None
+    assert 'unrecognized validation error' in recovery.abort_reason
+    for info in recovery.types.values():
+        assert not {'foo', 'bar', 'baz', 'qux'} & set(info['fields'])
+
+
+def test_no_probes_after_abort(server, monkeypatch):
+    late_documents = []
+
+    def post(self, document):
+        if self.abort_reason:
+            late_documents.append(document)
+        data = server.post(document)
+        for error in data.get('errors', []):
+            if GQLXploer.PROBE_GUARD_FIELD not in error['message']:
+                error['message'] = graphql_java_wording(error['message'])
+        return data
+
+    monkeypatch.setattr(GQLXploer.SchemaRecovery, '_post', post)
+
+    # One thread and small batches leave plenty of queued probes behind the first failure
+    recovery = GQLXploer.SchemaRecovery('http://target/graphql', WORDLIST, batch_size=2, threads=1)
+
+    assert recovery.run() is None
+    assert recovery.abort_reason
+    assert late_documents == []